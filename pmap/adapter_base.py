@@ -11,6 +11,14 @@ class Adapter(ABC):
 
     source_app: str = "unknown"
 
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "Adapter":
+        """
+        Build an instance from a connector spec (see PMAP_CONNECTORS).
+        Adapters with per-account settings override this.
+        """
+        return cls()
+
     @abstractmethod
     def discover(self) -> Dict[str, Any]:
         """Return capabilities, resource collections, version. Read-only."""
@@ -2,19 +2,86 @@
 """
 FastAPI app exposing read-only connector operations for AppFolio.
 """
+import json
 import os
 import uuid
-from fastapi import FastAPI, HTTPException, Request
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+from fastapi import Body, FastAPI, HTTPException, Query
 from fastapi.responses import JSONResponse
 from psycopg2.extras import DictCursor
 from .adapter_base import Adapter
 from .appfolio_adapter import AppFolioAdapter
-from .storage import connect, init_schema, now_iso
+from .storage import init_schema, now_iso
 from .event_bus import process_tuple
+from .limits import LIMITS
+from .scheduler import SyncScheduler
 
-app = FastAPI(title="PMAP Read-Only Connector", version="0.1")
+CONNECTOR_TYPES: dict[str, type[Adapter]] = {"appfolio": AppFolioAdapter}
 
-ADAPTERS: dict[str, Adapter] = {"appfolio": AppFolioAdapter()}
+SCHEDULER = SyncScheduler(workers=int(os.getenv("PMAP_SYNC_WORKERS", "4")))
+
+
+def _load_connectors(scheduler: SyncScheduler) -> list[str]:
+    """
+    Register connector instances from PMAP_CONNECTORS, a JSON list of
+    {"name", "type", "account", "interval_s", ...adapter config}.
+    Without it, a single "appfolio" connector is built from the APPFOLIO_* env.
+    Every spec is validated before any is registered; returns the names.
+    """
+    raw = os.getenv("PMAP_CONNECTORS")
+    if not raw:
+        interval = float(os.getenv("APPFOLIO_SYNC_INTERVAL_S", "0"))
+        scheduler.register("appfolio", AppFolioAdapter(), account="default", interval_s=interval)
+        return ["appfolio"]
+    try:
+        specs = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"PMAP_CONNECTORS is not valid JSON: {exc}") from exc
+    if not isinstance(specs, list):
+        raise ValueError("PMAP_CONNECTORS must be a JSON list of connector specs")
+
+    built = []
+    for i, spec in enumerate(specs):
+        if not isinstance(spec, dict):
+            raise ValueError(f"PMAP_CONNECTORS[{i}] must be an object: {spec!r}")
+        name = spec.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"PMAP_CONNECTORS[{i}] needs a non-empty \"name\": {spec!r}")
+        kind = spec.get("type", "appfolio")
+        if kind not in CONNECTOR_TYPES:
+            raise ValueError(f"connector {name}: unknown type {kind!r}, expected one of {sorted(CONNECTOR_TYPES)}")
+        account = spec.get("account", name)
+        if not isinstance(account, str) or not account:
+            raise ValueError(f"connector {name}: \"account\" must be a non-empty string")
+        interval = spec.get("interval_s", 0)
+        if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval < 0:
+            raise ValueError(f"connector {name}: \"interval_s\" must be a number >= 0")
+        if name in {b[0] for b in built}:
+            raise ValueError(f"connector {name}: duplicate name")
+        built.append((name, CONNECTOR_TYPES[kind].from_config(spec), account, float(interval)))
+
+    for name, adapter, account, interval in built:
+        scheduler.register(name, adapter, account=account, interval_s=interval)
+    return [b[0] for b in built]
+
+
+ADAPTERS: dict[str, Adapter] = SCHEDULER.adapters
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    names = _load_connectors(SCHEDULER)
+    SCHEDULER.start()
+    try:
+        yield
+    finally:
+        SCHEDULER.stop(timeout=30)
+        for name in names:
+            SCHEDULER.unregister(name)
+
+
+app = FastAPI(title="PMAP Read-Only Connector", version="0.1", lifespan=lifespan)
 
 
 @app.get("/health")
@@ -30,38 +97,50 @@ def discover(name: str):
     return adapter.discover()
 
 
-@app.post("/connectors/{name}/pull")
+@app.get("/connectors")
+def list_connectors():
+    return {"connectors": SCHEDULER.connectors()}
+
+
+@app.post("/connectors/{name}/pull", status_code=202)
 def pull(name: str):
-    adapter = ADAPTERS.get(name)
-    if not adapter:
-        raise HTTPException(404, f"unknown connector {name}")
-    conn = connect()
-    ingest_id = str(uuid.uuid4())
-    results = []
     try:
-        for et, rec in adapter.pull():
-            results.append(process_tuple(conn, ingest_id, et, rec))
-        conn.commit()
-    finally:
-        conn.close()
-    return {"ingest_id": ingest_id, "results": results}
+        job = SCHEDULER.submit(name)
+    except KeyError:
+        raise HTTPException(404, f"unknown connector {name}")
+    except RuntimeError as exc:
+        raise HTTPException(503, str(exc))
+    return job.to_dict()
+
+
+@app.get("/jobs")
+def jobs(
+    connector: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=SCHEDULER.max_jobs_retained),
+):
+    return {"jobs": [j.to_dict() for j in SCHEDULER.list_jobs(connector, limit)]}
+
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    job = SCHEDULER.get_job(job_id)
+    if not job:
+        raise HTTPException(404, f"unknown job {job_id}")
+    return job.to_dict()
 
 
 @app.post("/connectors/{name}/webhook")
-async def webhook(name: str, request: Request):
-    adapter = ADAPTERS.get(name)
-    if not adapter:
+def webhook(name: str, payload: Dict[str, Any] = Body(...)):
+    # Plain def: waiting for a DB slot blocks a threadpool worker, not the event loop.
+    connector = SCHEDULER.get_connector(name)
+    if not connector:
         raise HTTPException(404, f"unknown connector {name}")
-    payload = await request.json()
-    conn = connect()
     ingest_id = str(uuid.uuid4())
     results = []
-    try:
-        for et, rec in adapter.webhook(payload):
-            results.append(process_tuple(conn, ingest_id, et, rec))
+    with LIMITS.db_connection() as conn:
+        for et, rec in connector.adapter.webhook(payload):
+            results.append(process_tuple(conn, ingest_id, et, rec, account=connector.account))
         conn.commit()
-    finally:
-        conn.close()
     return {"ingest_id": ingest_id, "results": results}
 
 
@@ -75,13 +154,10 @@ def reconcile(name: str):
 
 @app.get("/events")
 def events(limit: int = 50):
-    conn = connect()
-    try:
+    with LIMITS.db_connection() as conn:
         with conn.cursor(cursor_factory=DictCursor) as cur:
             cur.execute(
                 "SELECT * FROM audit_events ORDER BY id DESC LIMIT %s", (limit,)
             )
             rows = [dict(r) for r in cur.fetchall()]
             return {"events": rows}
-    finally:
-        conn.close()
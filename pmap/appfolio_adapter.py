@@ -4,8 +4,9 @@ AppFolio read-only adapter using a mock API server for testing.
 """
 import os
 import httpx
-from typing import Dict, Any, Iterable, Tuple, List
+from typing import Dict, Any, Iterable, Tuple, List, Optional
 from .adapter_base import Adapter
+from .limits import LIMITS
 
 class AppFolioClient:
     def __init__(self, base_url: str, api_key: str):
@@ -14,7 +15,7 @@ class AppFolioClient:
         self.headers = {"X-API-KEY": self.api_key}
 
     def _get(self, endpoint: str) -> List[Dict[str, Any]]:
-        with httpx.Client() as client:
+        with LIMITS.vendor_request(), httpx.Client() as client:
             response = client.get(f"{self.base_url}/{endpoint}", headers=self.headers)
             response.raise_for_status()
             return response.json()
@@ -38,11 +39,16 @@ class AppFolioClient:
 class AppFolioAdapter(Adapter):
     source_app = "appfolio"
 
-    def __init__(self):
-        base_url = os.getenv("APPFOLIO_API_URL", "http://localhost:8001")
-        api_key = os.getenv("APPFOLIO_API_KEY", "fake-appfolio-api-key")
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+        # Per-account credentials; fall back to env for the default instance.
+        base_url = base_url or os.getenv("APPFOLIO_API_URL", "http://localhost:8001")
+        api_key = api_key or os.getenv("APPFOLIO_API_KEY", "fake-appfolio-api-key")
         self.client = AppFolioClient(base_url, api_key)
 
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "AppFolioAdapter":
+        return cls(base_url=config.get("base_url"), api_key=config.get("api_key"))
+
     def discover(self) -> Dict[str, Any]:
         return {
             "source_app": self.source_app,
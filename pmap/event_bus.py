@@ -11,13 +11,15 @@ def _hash(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
-def normalize(entity_type: str, record: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+def normalize(entity_type: str, record: Dict[str, Any],
+              account: str = "default") -> Tuple[str, Dict[str, Any]]:
     # Map minimal fields. Real field shapes are vendor-specific [u ❓].
     fetched_at = now_iso()
     if entity_type == "property":
         ext = record["id"]
         unified = {
             "source_app": "appfolio",
+            "account": account,
             "external_id": ext,
             "name": record.get("name"),
             "address": record.get("address"),
@@ -33,6 +35,7 @@ def normalize(entity_type: str, record: Dict[str, Any]) -> Tuple[str, Dict[str,
     if entity_type == "unit":
         unified = {
             "source_app": "appfolio",
+            "account": account,
             "external_id": record["id"],
             "property_external_id": record["property_id"],
             "label": record.get("label"),
@@ -48,6 +51,7 @@ def normalize(entity_type: str, record: Dict[str, Any]) -> Tuple[str, Dict[str,
     if entity_type == "tenant":
         unified = {
             "source_app": "appfolio",
+            "account": account,
             "external_id": record["id"],
             "full_name": record.get("full_name"),
             "email_hash": _hash(record["email"]) if record.get("email") else None,
@@ -60,6 +64,7 @@ def normalize(entity_type: str, record: Dict[str, Any]) -> Tuple[str, Dict[str,
     if entity_type == "lease":
         unified = {
             "source_app": "appfolio",
+            "account": account,
             "external_id": record["id"],
             "unit_external_id": record["unit_id"],
             "tenant_external_id": record["tenant_id"],
@@ -75,6 +80,7 @@ def normalize(entity_type: str, record: Dict[str, Any]) -> Tuple[str, Dict[str,
     if entity_type == "payment":
         unified = {
             "source_app": "appfolio",
+            "account": account,
             "external_id": record["id"],
             "tenant_external_id": record["tenant_id"],
             "lease_external_id": record.get("lease_id"),
@@ -89,12 +95,14 @@ def normalize(entity_type: str, record: Dict[str, Any]) -> Tuple[str, Dict[str,
     raise ValueError(f"Unsupported entity_type: {entity_type}")
 
 
-def process_tuple(conn, ingest_id: str, entity_type: str, record: Dict[str, Any]) -> Dict[str, Any]:
-    table, unified = normalize(entity_type, record)
+def process_tuple(conn, ingest_id: str, entity_type: str, record: Dict[str, Any],
+                  account: str = "default") -> Dict[str, Any]:
+    table, unified = normalize(entity_type, record, account)
 
     # Persist raw
     write_raw(conn, {
         "source_app": "appfolio",
+        "account": account,
         "external_id": unified["external_id"],
         "entity_type": table,
         "payload_json": record,
@@ -104,7 +112,7 @@ def process_tuple(conn, ingest_id: str, entity_type: str, record: Dict[str, Any]
     # Upsert
     changed = upsert(
         conn, table,
-        unique_keys=("source_app", "external_id"),
+        unique_keys=("source_app", "account", "external_id"),
         data=unified
     )
 
@@ -119,6 +127,7 @@ def process_tuple(conn, ingest_id: str, entity_type: str, record: Dict[str, Any]
     write_audit(conn, {
         "ingest_id": ingest_id,
         "source_app": "appfolio",
+        "account": account,
         "event_type": event_type_map[table] if changed else "Noop",
         "external_id": unified["external_id"],
         "actor": "connector@appfolio",
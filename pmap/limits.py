@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Process-wide caps on open DB connections and in-flight vendor requests.
+Every code path that opens a connection or calls a vendor goes through LIMITS.
+"""
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from .storage import connect
+
+
+class Limiter:
+    def __init__(self, max_db_connections: int, max_vendor_requests: int,
+                 connect_fn: Callable[[], Any] = connect):
+        self.max_db_connections = max_db_connections
+        self.max_vendor_requests = max_vendor_requests
+        self._connect = connect_fn
+        self._db_slots = threading.BoundedSemaphore(max_db_connections)
+        self._vendor_slots = threading.BoundedSemaphore(max_vendor_requests)
+
+    @contextmanager
+    def db_connection(self) -> Iterator[Any]:
+        """Hold a DB slot for the lifetime of one connection. Caller commits."""
+        with self._db_slots:
+            conn = self._connect()
+            try:
+                yield conn
+            finally:
+                conn.close()
+
+    @contextmanager
+    def vendor_request(self) -> Iterator[None]:
+        """Hold a vendor slot for the duration of one outbound request."""
+        with self._vendor_slots:
+            yield
+
+
+LIMITS = Limiter(
+    max_db_connections=int(os.getenv("PMAP_MAX_DB_CONNECTIONS", "4")),
+    max_vendor_requests=int(os.getenv("PMAP_MAX_VENDOR_REQUESTS", "8")),
+)
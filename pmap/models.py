@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 
 class PropertyIn(BaseModel):
     source_app: str = "appfolio"
+    account: str = "default"
     external_id: str
     name: Optional[str] = None
     address: Optional[str] = None
@@ -21,6 +22,7 @@ class PropertyIn(BaseModel):
 
 class UnitIn(BaseModel):
     source_app: str = "appfolio"
+    account: str = "default"
     external_id: str
     property_external_id: str
     label: Optional[str] = None
@@ -34,6 +36,7 @@ class UnitIn(BaseModel):
 
 class TenantIn(BaseModel):
     source_app: str = "appfolio"
+    account: str = "default"
     external_id: str
     full_name: Optional[str] = None
     email_hash: Optional[str] = None
@@ -44,6 +47,7 @@ class TenantIn(BaseModel):
 
 class LeaseIn(BaseModel):
     source_app: str = "appfolio"
+    account: str = "default"
     external_id: str
     unit_external_id: str
     tenant_external_id: str
@@ -57,6 +61,7 @@ class LeaseIn(BaseModel):
 
 class PaymentIn(BaseModel):
     source_app: str = "appfolio"
+    account: str = "default"
     external_id: str
     tenant_external_id: str
     lease_external_id: Optional[str] = None
@@ -70,6 +75,7 @@ class PaymentIn(BaseModel):
 class AuditEvent(BaseModel):
     ingest_id: str
     source_app: str
+    account: str = "default"
     event_type: Literal[
         "PropertyUpserted","UnitUpserted","TenantUpserted","LeaseUpserted","PaymentRecorded",
         "Noop","Error"
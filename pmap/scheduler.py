@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Sync scheduler: registers connector instances and runs their pulls as jobs
+on a shared worker pool, one in-flight sync per connector, round-robin across
+accounts, with global caps on DB connections and vendor requests.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .adapter_base import Adapter
+from .event_bus import process_tuple
+from .limits import LIMITS, Limiter
+from .storage import now_iso
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class Connector:
+    name: str
+    adapter: Adapter
+    account: str
+    interval_s: float = 0.0  # 0 disables periodic pulls
+    next_run: float = 0.0
+
+
+@dataclass
+class Job:
+    job_id: str
+    connector: str
+    account: str
+    status: str = QUEUED
+    submitted_at: str = field(default_factory=now_iso)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    fetched: int = 0
+    records: int = 0
+    changed: int = 0
+    error: Optional[str] = None
+    _t_start: Optional[float] = None
+    _t_end: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = 0.0
+        if self._t_start is not None:
+            elapsed = (self._t_end or time.monotonic()) - self._t_start
+        return {
+            "job_id": self.job_id,
+            "ingest_id": self.job_id,
+            "connector": self.connector,
+            "account": self.account,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "fetched": self.fetched,
+            "records": self.records,
+            "changed": self.changed,
+            "elapsed_s": round(elapsed, 3),
+            "records_per_s": round(self.records / elapsed, 2) if elapsed > 0 else 0.0,
+            "error": self.error,
+        }
+
+
+class SyncScheduler:
+    """
+    Shared worker pool for connector pulls.
+
+    Pending jobs are kept in one queue per account and workers take from the
+    accounts in rotation, so a client with many connectors cannot starve the
+    others. A connector has at most one queued-or-running job; submitting
+    again returns the existing job.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_jobs_retained: int = 500,
+        tick_s: float = 1.0,
+        limiter: Limiter = LIMITS,
+        process_fn: Callable[..., Dict[str, Any]] = process_tuple,
+    ):
+        self.adapters: Dict[str, Adapter] = {}
+        self.workers = workers
+        self.tick_s = tick_s
+        self.max_jobs_retained = max_jobs_retained
+        self._limiter = limiter
+        self._process = process_fn
+        self._connectors: Dict[str, Connector] = {}
+        self._pending: "OrderedDict[str, Deque[Job]]" = OrderedDict()
+        self._active: Dict[str, Job] = {}  # connector name -> queued/running job
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self._generation = 0  # bumped by start(); older threads exit on mismatch
+
+    # Registry
+
+    def register(self, name: str, adapter: Adapter, account: Optional[str] = None,
+                 interval_s: float = 0.0) -> Connector:
+        with self._cond:
+            if name in self._connectors:
+                raise ValueError(f"connector {name} already registered")
+            c = Connector(name=name, adapter=adapter, account=account or name,
+                          interval_s=interval_s, next_run=time.monotonic() + interval_s)
+            self._connectors[name] = c
+            self.adapters[name] = adapter
+            return c
+
+    def unregister(self, name: str) -> None:
+        with self._cond:
+            self._connectors.pop(name, None)
+            self.adapters.pop(name, None)
+
+    def get_connector(self, name: str) -> Optional[Connector]:
+        with self._cond:
+            return self._connectors.get(name)
+
+    def connectors(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            return [
+                {
+                    "name": c.name,
+                    "source_app": c.adapter.source_app,
+                    "account": c.account,
+                    "interval_s": c.interval_s,
+                    "active_job_id": self._active[c.name].job_id if c.name in self._active else None,
+                }
+                for c in self._connectors.values()
+            ]
+
+    # Jobs
+
+    def submit(self, name: str) -> Job:
+        """Queue a pull for `name`, or return the job already queued/running for it."""
+        with self._cond:
+            c = self._connectors.get(name)
+            if c is None:
+                raise KeyError(name)
+            if self._stopping:
+                raise RuntimeError("scheduler is stopping")
+            existing = self._active.get(name)
+            if existing is not None:
+                return existing
+            job = Job(job_id=str(uuid.uuid4()), connector=name, account=c.account)
+            self._active[name] = job
+            self._jobs[job.job_id] = job
+            self._trim_jobs()
+            self._pending.setdefault(c.account, deque()).append(job)
+            self._cond.notify_all()
+            return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, connector: Optional[str] = None, limit: int = 50) -> List[Job]:
+        with self._cond:
+            jobs = [j for j in reversed(self._jobs.values())
+                    if connector is None or j.connector == connector]
+            return jobs[:limit]
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until the job finishes or `timeout` elapses; return the job."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            job = self._jobs.get(job_id)
+            while job is not None and job.status in (QUEUED, RUNNING):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return job
+
+    def _trim_jobs(self) -> None:
+        # Drop the oldest finished jobs; queued/running ones are always kept.
+        excess = len(self._jobs) - self.max_jobs_retained
+        if excess <= 0:
+            return
+        for job_id in [j.job_id for j in self._jobs.values()
+                       if j.status in (SUCCEEDED, FAILED, CANCELLED)][:excess]:
+            del self._jobs[job_id]
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """
+        Start a fresh set of workers and a ticker. Threads left over from a
+        stop() that timed out finish their current job and then exit.
+        """
+        with self._cond:
+            if self._threads and not self._stopping:
+                return
+            self._stopping = False
+            self._generation += 1
+            gen = self._generation
+            new = [
+                threading.Thread(target=self._worker, args=(gen,), name=f"pmap-sync-{gen}-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            new.append(
+                threading.Thread(target=self._ticker, args=(gen,), name=f"pmap-sync-ticker-{gen}", daemon=True)
+            )
+            self._threads = [t for t in self._threads if t.is_alive()] + new
+            self._cond.notify_all()
+        for t in new:
+            t.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Cancel queued jobs, refuse new submits, and wait up to `timeout` in
+        total for running jobs to finish.
+        """
+        with self._cond:
+            self._stopping = True
+            for queue in self._pending.values():
+                for job in queue:
+                    job.status = CANCELLED
+                    job.error = "scheduler stopped"
+                    job.finished_at = now_iso()
+                    self._active.pop(job.connector, None)
+            self._pending.clear()
+            self._cond.notify_all()
+            threads = list(self._threads)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for t in threads:
+            t.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        with self._cond:
+            # Keep threads that outlived the timeout so a later stop() can join them.
+            self._threads = [t for t in self._threads if t.is_alive()]
+
+    def _retired(self, gen: int) -> bool:
+        # Caller holds self._cond.
+        return self._stopping or gen != self._generation
+
+    def _ticker(self, gen: int) -> None:
+        while True:
+            with self._cond:
+                if self._retired(gen):
+                    return
+                now = time.monotonic()
+                due = [c for c in self._connectors.values()
+                       if c.interval_s > 0 and c.next_run <= now]
+                for c in due:
+                    c.next_run = now + c.interval_s
+            for c in due:
+                try:
+                    self.submit(c.name)
+                except KeyError:
+                    pass  # unregistered between scan and submit
+                except RuntimeError:
+                    return  # stopping
+            with self._cond:
+                if self._retired(gen):
+                    return
+                self._cond.wait(self.tick_s)
+
+    def _next_job(self) -> Optional[Job]:
+        # Caller holds self._cond. Rotate accounts so each gets a turn.
+        if not self._pending:
+            return None
+        account, queue = next(iter(self._pending.items()))
+        job = queue.popleft()
+        if queue:
+            self._pending.move_to_end(account)
+        else:
+            del self._pending[account]
+        return job
+
+    def _worker(self, gen: int) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._retired(gen):
+                        return
+                    job = self._next_job()
+                    if job is not None:
+                        break
+                    self._cond.wait()
+                connector = self._connectors.get(job.connector)
+                job.status = RUNNING
+                job.started_at = now_iso()
+                job._t_start = time.monotonic()
+            status, error = FAILED, "sync interrupted"
+            try:
+                if connector is None:
+                    raise RuntimeError(f"connector {job.connector} was unregistered")
+                self._run(job, connector.adapter)
+                status, error = SUCCEEDED, None
+            except Exception as exc:  # job failures are reported, not raised
+                status, error = FAILED, f"{type(exc).__name__}: {exc}"
+            finally:
+                # Runs even on BaseException so the connector can sync again.
+                with self._cond:
+                    job.status = status
+                    job.error = error
+                    job.finished_at = now_iso()
+                    job._t_end = time.monotonic()
+                    self._active.pop(job.connector, None)
+                    self._cond.notify_all()
+
+    def _run(self, job: Job, adapter: Adapter) -> None:
+        # Fetch first, then write: a DB slot is never held while waiting on the
+        # vendor. Adapters cap their own requests via LIMITS.vendor_request().
+        items = []
+        for item in adapter.pull():
+            items.append(item)
+            with self._cond:
+                job.fetched += 1
+        with self._limiter.db_connection() as conn:
+            for et, rec in items:
+                res = self._process(conn, job.job_id, et, rec, account=job.account)
+                with self._cond:
+                    job.records += 1
+                    if res.get("changed"):
+                        job.changed += 1
+            conn.commit()
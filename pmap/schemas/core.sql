@@ -3,6 +3,7 @@
 CREATE TABLE IF NOT EXISTS properties (
   id SERIAL PRIMARY KEY,
   source_app TEXT NOT NULL,
+  account TEXT NOT NULL DEFAULT 'default',
   external_id TEXT NOT NULL,
   name TEXT,
   address TEXT,
@@ -11,13 +12,13 @@ CREATE TABLE IF NOT EXISTS properties (
   postal_code TEXT,
   active INTEGER DEFAULT 1,
   checksum TEXT NOT NULL,
-  fetched_at TEXT NOT NULL,
-  UNIQUE(source_app, external_id)
+  fetched_at TEXT NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS units (
   id SERIAL PRIMARY KEY,
   source_app TEXT NOT NULL,
+  account TEXT NOT NULL DEFAULT 'default',
   external_id TEXT NOT NULL,
   property_external_id TEXT NOT NULL,
   label TEXT,
@@ -26,25 +27,25 @@ CREATE TABLE IF NOT EXISTS units (
   sqft INTEGER,
   status TEXT,
   checksum TEXT NOT NULL,
-  fetched_at TEXT NOT NULL,
-  UNIQUE(source_app, external_id)
+  fetched_at TEXT NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS tenants (
   id SERIAL PRIMARY KEY,
   source_app TEXT NOT NULL,
+  account TEXT NOT NULL DEFAULT 'default',
   external_id TEXT NOT NULL,
   full_name TEXT,
   email_hash TEXT,
   phone_hash TEXT,
   checksum TEXT NOT NULL,
-  fetched_at TEXT NOT NULL,
-  UNIQUE(source_app, external_id)
+  fetched_at TEXT NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS leases (
   id SERIAL PRIMARY KEY,
   source_app TEXT NOT NULL,
+  account TEXT NOT NULL DEFAULT 'default',
   external_id TEXT NOT NULL,
   unit_external_id TEXT NOT NULL,
   tenant_external_id TEXT NOT NULL,
@@ -53,13 +54,13 @@ CREATE TABLE IF NOT EXISTS leases (
   rent_cents INTEGER,
   status TEXT,
   checksum TEXT NOT NULL,
-  fetched_at TEXT NOT NULL,
-  UNIQUE(source_app, external_id)
+  fetched_at TEXT NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS payments (
   id SERIAL PRIMARY KEY,
   source_app TEXT NOT NULL,
+  account TEXT NOT NULL DEFAULT 'default',
   external_id TEXT NOT NULL,
   tenant_external_id TEXT NOT NULL,
   lease_external_id TEXT,
@@ -67,13 +68,13 @@ CREATE TABLE IF NOT EXISTS payments (
   posted_date TEXT,
   method TEXT,
   checksum TEXT NOT NULL,
-  fetched_at TEXT NOT NULL,
-  UNIQUE(source_app, external_id)
+  fetched_at TEXT NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS raw_payloads (
   id SERIAL PRIMARY KEY,
   source_app TEXT NOT NULL,
+  account TEXT NOT NULL DEFAULT 'default',
   external_id TEXT NOT NULL,
   entity_type TEXT NOT NULL,
   payload_json TEXT NOT NULL,
@@ -84,6 +85,7 @@ CREATE TABLE IF NOT EXISTS audit_events (
   id SERIAL PRIMARY KEY,
   ingest_id TEXT NOT NULL,
   source_app TEXT NOT NULL,
+  account TEXT NOT NULL DEFAULT 'default',
   event_type TEXT NOT NULL,
   external_id TEXT NOT NULL,
   actor TEXT NOT NULL,
@@ -92,3 +94,23 @@ CREATE TABLE IF NOT EXISTS audit_events (
   created_at TEXT NOT NULL,
   message TEXT
 );
+
+-- Vendor ids are only unique within one client account. The ALTERs bring
+-- databases created before the account column up to date.
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS account TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE units ADD COLUMN IF NOT EXISTS account TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE tenants ADD COLUMN IF NOT EXISTS account TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE leases ADD COLUMN IF NOT EXISTS account TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE payments ADD COLUMN IF NOT EXISTS account TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE raw_payloads ADD COLUMN IF NOT EXISTS account TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE audit_events ADD COLUMN IF NOT EXISTS account TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE properties DROP CONSTRAINT IF EXISTS properties_source_app_external_id_key;
+ALTER TABLE units DROP CONSTRAINT IF EXISTS units_source_app_external_id_key;
+ALTER TABLE tenants DROP CONSTRAINT IF EXISTS tenants_source_app_external_id_key;
+ALTER TABLE leases DROP CONSTRAINT IF EXISTS leases_source_app_external_id_key;
+ALTER TABLE payments DROP CONSTRAINT IF EXISTS payments_source_app_external_id_key;
+CREATE UNIQUE INDEX IF NOT EXISTS properties_account_external_id_key ON properties (source_app, account, external_id);
+CREATE UNIQUE INDEX IF NOT EXISTS units_account_external_id_key ON units (source_app, account, external_id);
+CREATE UNIQUE INDEX IF NOT EXISTS tenants_account_external_id_key ON tenants (source_app, account, external_id);
+CREATE UNIQUE INDEX IF NOT EXISTS leases_account_external_id_key ON leases (source_app, account, external_id);
+CREATE UNIQUE INDEX IF NOT EXISTS payments_account_external_id_key ON payments (source_app, account, external_id);
@@ -85,9 +85,10 @@ def write_audit(conn, event: Dict[str, Any]) -> None:
 def write_raw(conn, payload: Dict[str, Any]) -> None:
     with conn.cursor() as cur:
         cur.execute(
-            "INSERT INTO raw_payloads (source_app, external_id, entity_type, payload_json, fetched_at) VALUES (%s,%s,%s,%s,%s)",
+            "INSERT INTO raw_payloads (source_app, account, external_id, entity_type, payload_json, fetched_at) VALUES (%s,%s,%s,%s,%s,%s)",
             (
-                payload["source_app"], payload["external_id"], payload["entity_type"],
+                payload["source_app"], payload.get("account", "default"),
+                payload["external_id"], payload["entity_type"],
                 json.dumps(payload["payload_json"], separators=(",", ":"), sort_keys=True),
                 payload["fetched_at"]
             )
@@ -36,3 +36,20 @@ def test_pull_and_upsert_idempotent():
 
     assert count_changed > 0
     assert count_noop >= 5  # 5 sample entities
+
+def test_accounts_do_not_share_rows():
+    ad = AppFolioAdapter()
+    conn = connect()
+    records = list(ad.pull())
+    first = [process_tuple(conn, "ingest-a", et, rec, account="acct_a") for et, rec in records]
+    second = [process_tuple(conn, "ingest-b", et, rec, account="acct_b") for et, rec in records]
+    conn.commit()
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM properties")
+        props = cur.fetchone()[0]
+    conn.close()
+
+    # Same vendor ids under another account are new rows, not no-ops.
+    assert all(r["changed"] for r in first)
+    assert all(r["changed"] for r in second)
+    assert props == 2
@@ -2,9 +2,14 @@
 """
 API integration tests with TestClient.
 """
+import asyncio
 import os
+import threading
+import time
+import httpx
 from fastapi.testclient import TestClient
 from ..storage import connect, truncate_tables
+from ..limits import Limiter
 from .. import api
 
 def setup_function(function):
@@ -16,6 +21,16 @@ def setup_function(function):
 
 client = TestClient(api.app)
 
+
+def setup_module(module):
+    """Run the app lifespan so connectors are registered and the scheduler runs."""
+    client.__enter__()
+
+
+def teardown_module(module):
+    client.__exit__(None, None, None)
+
+
 def test_health():
     r = client.get("/health")
     assert r.status_code == 200
@@ -30,10 +45,15 @@ def test_discover():
 
 def test_pull_and_events():
     r = client.post("/connectors/appfolio/pull")
-    assert r.status_code == 200
+    assert r.status_code == 202
     body = r.json()
     assert "ingest_id" in body
-    assert len(body["results"]) >= 5
+    assert body["status"] in ("queued", "running")
+
+    api.SCHEDULER.wait(body["job_id"], timeout=30)
+    job = client.get(f"/jobs/{body['job_id']}").json()
+    assert job["status"] == "succeeded"
+    assert job["records"] >= 5
 
     ev = client.get("/events?limit=10")
     assert ev.status_code == 200
@@ -47,3 +67,75 @@ def test_webhook_path():
     r = client.post("/connectors/appfolio/webhook", json=payload)
     assert r.status_code == 200
     assert r.json()["results"][0]["table"] == "tenants"
+
+def test_unknown_job():
+    r = client.get("/jobs/nope")
+    assert r.status_code == 404
+
+def test_list_connectors():
+    r = client.get("/connectors")
+    assert r.status_code == 200
+    names = [c["name"] for c in r.json()["connectors"]]
+    assert "appfolio" in names
+
+def test_list_jobs():
+    job_id = client.post("/connectors/appfolio/pull").json()["job_id"]
+    api.SCHEDULER.wait(job_id, timeout=30)
+
+    r = client.get("/jobs?connector=appfolio&limit=5")
+    assert r.status_code == 200
+    jobs = r.json()["jobs"]
+    assert jobs[0]["job_id"] == job_id
+    assert all(j["connector"] == "appfolio" for j in jobs)
+
+    assert client.get("/jobs?limit=-1").status_code == 422
+
+
+class _NullConn:
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_webhook_waiting_for_db_does_not_block_server(monkeypatch):
+    limiter = Limiter(max_db_connections=1, max_vendor_requests=1, connect_fn=_NullConn)
+    monkeypatch.setattr(api, "LIMITS", limiter)
+    monkeypatch.setattr(api, "process_tuple",
+                        lambda conn, ingest_id, et, rec, account: {"table": "tenants"})
+    held, release = threading.Event(), threading.Event()
+
+    def hold_slot():
+        with limiter.db_connection():
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_slot)
+    holder.start()
+    held.wait(5)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            hook = asyncio.create_task(ac.post(
+                "/connectors/appfolio/webhook",
+                json={"entity_type": "tenant", "data": {"id": "ten_1"}},
+            ))
+            await asyncio.sleep(0.1)
+            t0 = time.monotonic()
+            health = await ac.get("/health")
+            elapsed = time.monotonic() - t0
+            waiting = not hook.done()
+            release.set()
+            return health, elapsed, waiting, await hook
+
+    try:
+        health, elapsed, waiting, hook = asyncio.run(scenario())
+    finally:
+        release.set()
+        holder.join()
+    assert health.status_code == 200
+    assert elapsed < 1
+    assert waiting
+    assert hook.status_code == 200
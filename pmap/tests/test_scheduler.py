@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Scheduler tests with an in-memory adapter and no database.
+"""
+import json
+import re
+import threading
+import time
+import pytest
+from .. import api
+from ..adapter_base import Adapter
+from ..limits import Limiter
+from ..scheduler import SyncScheduler
+
+
+class _Conn:
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _FakeAdapter(Adapter):
+    source_app = "fake"
+
+    def __init__(self, n=3, gate=None, log=None, tag=None):
+        self.n, self.gate, self.log, self.tag = n, gate, log, tag
+
+    def discover(self):
+        return {}
+
+    def pull(self):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.log is not None:
+            self.log.append(self.tag)
+        for i in range(self.n):
+            yield "property", {"id": f"p{i}"}
+
+    def webhook(self, payload):
+        return []
+
+    def reconcile(self):
+        return {}
+
+
+def _scheduler(limiter=None, **kw):
+    return SyncScheduler(
+        limiter=limiter or Limiter(4, 8, connect_fn=_Conn),
+        process_fn=lambda conn, ingest_id, et, rec, account: {"changed": True},
+        **kw,
+    )
+
+
+def test_job_runs_and_reports_progress():
+    s = _scheduler(workers=2)
+    s.register("a", _FakeAdapter(n=4))
+    s.start()
+    try:
+        job = s.wait(s.submit("a").job_id, timeout=5)
+    finally:
+        s.stop(timeout=5)
+    d = job.to_dict()
+    assert d["status"] == "succeeded"
+    assert d["records"] == 4 and d["changed"] == 4
+    assert d["records_per_s"] >= 0
+
+
+def test_one_inflight_job_per_connector():
+    gate = threading.Event()
+    s = _scheduler(workers=2)
+    s.register("a", _FakeAdapter(gate=gate))
+    s.start()
+    try:
+        first = s.submit("a")
+        assert s.submit("a").job_id == first.job_id
+        gate.set()
+        s.wait(first.job_id, timeout=5)
+        assert s.submit("a").job_id != first.job_id
+    finally:
+        gate.set()
+        s.stop(timeout=5)
+
+
+def test_accounts_take_turns():
+    log = []
+    s = _scheduler(workers=1)
+    for i in range(3):
+        s.register(f"big{i}", _FakeAdapter(log=log, tag="big"), account="big")
+    s.register("small0", _FakeAdapter(log=log, tag="small"), account="small")
+    jobs = [s.submit(f"big{i}") for i in range(3)] + [s.submit("small0")]
+    s.start()
+    try:
+        for j in jobs:
+            s.wait(j.job_id, timeout=5)
+    finally:
+        s.stop(timeout=5)
+    assert log[:2] == ["big", "small"]
+
+
+def test_failed_pull_is_reported():
+    class Broken(_FakeAdapter):
+        def pull(self):
+            raise RuntimeError("vendor down")
+
+    s = _scheduler(workers=1)
+    s.register("a", Broken())
+    s.start()
+    try:
+        job = s.wait(s.submit("a").job_id, timeout=5)
+    finally:
+        s.stop(timeout=5)
+    assert job.status == "failed"
+    assert "vendor down" in job.error
+
+
+def test_periodic_connector_is_submitted_by_ticker():
+    s = _scheduler(workers=1, tick_s=0.01)
+    s.register("a", _FakeAdapter(), interval_s=0.05)
+    s.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not s.list_jobs("a") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        jobs = s.list_jobs("a")
+        assert jobs
+        assert s.wait(jobs[0].job_id, timeout=5).status == "succeeded"
+    finally:
+        s.stop(timeout=5)
+
+
+class _Counter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self):
+        with self.lock:
+            self.current -= 1
+
+
+def test_concurrent_pulls_respect_global_caps():
+    db, vendor = _Counter(), _Counter()
+
+    class CountingConn(_Conn):
+        def __init__(self):
+            db.enter()
+
+        def close(self):
+            db.exit()
+
+    limiter = Limiter(max_db_connections=2, max_vendor_requests=3, connect_fn=CountingConn)
+
+    class CountingAdapter(_FakeAdapter):
+        def pull(self):
+            for i in range(3):
+                with limiter.vendor_request():
+                    vendor.enter()
+                    time.sleep(0.01)
+                    vendor.exit()
+                yield "property", {"id": f"p{i}"}
+
+    def slow_process(conn, ingest_id, et, rec, account):
+        time.sleep(0.01)
+        return {"changed": True}
+
+    s = SyncScheduler(workers=8, limiter=limiter, process_fn=slow_process)
+    for i in range(8):
+        s.register(f"c{i}", CountingAdapter(), account=f"acct{i}")
+    s.start()
+    try:
+        jobs = [s.submit(f"c{i}") for i in range(8)]
+        results = [s.wait(j.job_id, timeout=10) for j in jobs]
+    finally:
+        s.stop(timeout=5)
+    assert all(j.status == "succeeded" for j in results)
+    assert 1 <= db.peak <= 2
+    assert 1 <= vendor.peak <= 3
+
+
+def test_unregister_while_queued_fails_job():
+    s = _scheduler(workers=1)
+    s.register("a", _FakeAdapter())
+    job = s.submit("a")
+    s.unregister("a")
+    s.start()
+    try:
+        job = s.wait(job.job_id, timeout=5)
+    finally:
+        s.stop(timeout=5)
+    assert job.status == "failed"
+    assert "unregistered" in job.error
+
+
+def test_stop_cancels_queued_jobs_and_refuses_submits():
+    s = _scheduler(workers=1)
+    s.register("a", _FakeAdapter())
+    job = s.submit("a")
+    s.stop(timeout=1)
+    assert job.status == "cancelled"
+    with pytest.raises(RuntimeError):
+        s.submit("a")
+
+    s.start()
+    try:
+        again = s.submit("a")
+        assert again.job_id != job.job_id
+        assert s.wait(again.job_id, timeout=5).status == "succeeded"
+    finally:
+        s.stop(timeout=5)
+
+
+class _Boom(BaseException):
+    pass
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_base_exception_releases_connector():
+    class Exploding(_FakeAdapter):
+        def pull(self):
+            raise _Boom()
+
+    s = _scheduler(workers=2)
+    s.register("a", Exploding())
+    s.start()
+    try:
+        job = s.wait(s.submit("a").job_id, timeout=5)
+        assert job.status == "failed"
+        assert s.submit("a").job_id != job.job_id
+    finally:
+        s.stop(timeout=5)
+
+
+def test_load_connectors_from_env(monkeypatch):
+    monkeypatch.setenv("PMAP_CONNECTORS", json.dumps([
+        {"name": "acme", "account": "acme", "interval_s": 900, "base_url": "http://acme", "api_key": "k1"},
+        {"name": "beta", "type": "appfolio"},
+    ]))
+    s = _scheduler()
+    assert api._load_connectors(s) == ["acme", "beta"]
+    by_name = {c["name"]: c for c in s.connectors()}
+    assert by_name["acme"]["interval_s"] == 900
+    assert by_name["beta"]["account"] == "beta"
+    assert s.adapters["acme"].client.base_url == "http://acme"
+    assert s.adapters["acme"].client.api_key == "k1"
+
+
+@pytest.mark.parametrize("raw, message", [
+    ("not json", "not valid JSON"),
+    ('{"name": "a"}', "must be a JSON list"),
+    ('[{"type": "appfolio"}]', "PMAP_CONNECTORS[0]"),
+    ('[{"name": "a", "type": "yardi"}]', "connector a: unknown type"),
+    ('[{"name": "a", "interval_s": -1}]', "connector a"),
+    ('[{"name": "a"}, {"name": "a"}]', "connector a: duplicate"),
+])
+def test_load_connectors_rejects_bad_specs(monkeypatch, raw, message):
+    monkeypatch.setenv("PMAP_CONNECTORS", raw)
+    s = _scheduler()
+    with pytest.raises(ValueError, match=re.escape(message)):
+        api._load_connectors(s)
+    assert s.connectors() == []
+
+
+def test_restart_after_timed_out_stop_keeps_pool_size():
+    gate = threading.Event()
+    s = _scheduler(workers=1)
+    s.register("slow", _FakeAdapter(gate=gate))
+    s.register("fast", _FakeAdapter())
+    s.start()
+    try:
+        slow = s.submit("slow")
+        deadline = time.monotonic() + 5
+        while slow.status != "running" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        s.stop(timeout=0.05)
+        stragglers = [t for t in s._threads if t.is_alive()]
+        assert stragglers  # the worker stuck in the slow pull
+
+        s.start()
+        gate.set()
+        assert s.wait(slow.job_id, timeout=5).status == "succeeded"
+        for t in stragglers:
+            t.join(5)
+            assert not t.is_alive()
+        alive = [t for t in s._threads if t.is_alive()]
+        assert len(alive) == s.workers + 1  # one worker and one ticker
+
+        assert s.wait(s.submit("fast").job_id, timeout=5).status == "succeeded"
+    finally:
+        gate.set()
+        s.stop(timeout=5)